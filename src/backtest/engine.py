@@ -51,6 +51,7 @@ def run_task(task_name: str):
 		interval=data_cfg.get('interval', '1d'),
 		cache=data_cfg.get('cache', True),
 		refresh=data_cfg.get('refresh', False),
+		columns=getattr(strategy, 'required_columns', None),
 	)
 	logger.info("Data fetched: symbol=%s rows=%s start=%s end=%s", data_cfg['symbol'], len(df), df.index.min(), df.index.max())
 
@@ -1,12 +1,32 @@
 import os
 import pandas as pd
+from ..dtypes import cast_prices
 from ..exceptions import RateLimitError, AdapterError
+from ..ratelimit import TokenBucket
+from ..storage import cached
 # Use absolute import to reach the centralized system logger under `src.system`.
 from src.system.log import get_logger
 
 logger = get_logger(__name__)
 
-def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs): 
+# pre-throttle upstream requests so bursts don't trip provider limits
+_LIMITER = TokenBucket(rate=2, per=1.0)
+
+
+def _to_datetime(col):
+    """Parse a date column, taking the fixed-format fast path for YYYYMMDD / YYYY-MM-DD strings."""
+    sample = col.iloc[0] if len(col) else None
+    fmt = None
+    if isinstance(sample, str):
+        if len(sample) == 8 and sample.isdigit():
+            fmt = '%Y%m%d'
+        elif len(sample) == 10 and sample[4] == '-':
+            fmt = '%Y-%m-%d'
+    return pd.to_datetime(col, format=fmt, cache=True)
+
+
+@cached('akshare')
+def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
     """Fetch historical data using akshare and return a DataFrame (DatetimeIndex).
 
     Currently supports daily data via `ak.stock_zh_a_daily`. Other intervals are
@@ -23,6 +43,7 @@ def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
         logger.debug("akshare adapter: fetching %s %s-%s interval=%s", symbol, start, end, interval)
         if interval in ('1d', 'daily'):
             # akshare expects dates like YYYYMMDD or YYYY-MM-DD depending on function
+            _LIMITER.acquire()
             df = ak.stock_zh_a_daily(symbol=symbol, start_date=start, end_date=end)
             if df is None or df.empty:
                 logger.info("akshare adapter: no data for %s", symbol)
@@ -30,10 +51,11 @@ def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
 
             # akshare may return a 'date' column; convert to DatetimeIndex if present
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
+                df['date'] = _to_datetime(df['date'])
                 df = df.set_index('date')
             elif not isinstance(df.index, pd.DatetimeIndex):
                 df.index = pd.to_datetime(df.index)
+            df = cast_prices(df, kwargs.get('precision'))
 
             logger.info("akshare adapter: fetched %s rows for %s", len(df), symbol)
             return df
@@ -44,7 +66,9 @@ def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
         raise
     except Exception as e:
         msg = str(e).lower()
-        logger.exception("akshare adapter error for %s: %s", symbol, e)
         if 'rate' in msg or 'limit' in msg or 'too many requests' in msg:
+            # throttling is routine and retried upstream; skip the traceback
+            logger.warning("akshare adapter rate limited for %s: %s", symbol, e)
             raise RateLimitError(str(e))
+        logger.exception("akshare adapter error for %s: %s", symbol, e)
         raise AdapterError(str(e))
\ No newline at end of file
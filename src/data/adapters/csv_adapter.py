@@ -1,10 +1,70 @@
+import csv
 import os
+from functools import lru_cache
 import pandas as pd
+from ..dtypes import cast_prices
 # Use absolute import to reach the centralized system logger under `src.system`.
 from src.system.log import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import pyarrow  # noqa: F401  (only needed for the faster CSV parser)
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+# lowercase header name -> canonical OHLCV column name
+_COL_CANON = {
+    'open': 'Open', 'open_price': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close', 'close_price': 'Close',
+    'adj close': 'Adj Close', 'adj_close': 'Adj Close', 'adjclose': 'Adj Close',
+    'volume': 'Volume', 'vol': 'Volume',
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value):
+    """Parse a start/end bound once; sweeps reuse the same few date strings."""
+    return pd.to_datetime(value)
+
+
+def _to_datetime_index(index):
+    """Parse a non-datetime index; YYYYMMDD values (int or str) get an explicit format.
+
+    The pyarrow engine leaves 8-digit dates as int64, which plain pd.to_datetime
+    would read as nanoseconds since the epoch.
+    """
+    sample = str(index[0]) if len(index) else ''
+    if len(sample) == 8 and sample.isdigit():
+        return pd.to_datetime(index.astype(str), format='%Y%m%d')
+    return pd.to_datetime(index)
+
+
+def _symbol_names(symbol):
+    """Column names that may hold the symbol's own price series: the symbol and the file stem."""
+    return {symbol, os.path.splitext(os.path.basename(symbol))[0]}
+
+
+def _usecols(path, symbol):
+    """Header names worth parsing: the index (first) column, known OHLCV columns,
+    a generic `price` column and a column named after the symbol.
+
+    Returns None (parse everything) when the header can't be read or the index column is unnamed.
+    """
+    try:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not header or not header[0]:
+        return None
+    keep_names = _symbol_names(symbol)
+    return header[:1] + [c for c in header[1:]
+                         if c.lower() in _COL_CANON or c.lower() == 'price' or c in keep_names]
+
 
 def fetch(symbol, start, end, interval='1d', **kwargs):
     """Read historical data from a local CSV file.
@@ -26,41 +86,34 @@ def fetch(symbol, start, end, interval='1d', **kwargs):
         logger.debug("CSV adapter: file not found for %s -> %s", symbol, path)
         return pd.DataFrame()
 
+    usecols = _usecols(path, symbol)
     try:
-        df = pd.read_csv(path, parse_dates=True, index_col=0)
+        df = pd.read_csv(path, parse_dates=True, index_col=0, usecols=usecols, engine=_CSV_ENGINE)
     except Exception as e:
-        logger.exception("CSV adapter failed to read %s: %s", path, e)
-        return pd.DataFrame()
+        if _CSV_ENGINE == 'c':
+            logger.exception("CSV adapter failed to read %s: %s", path, e)
+            return pd.DataFrame()
+        # pyarrow is stricter (e.g. ragged rows); retry with the tolerant C parser
+        logger.warning("CSV adapter: pyarrow engine failed for %s (%s), retrying with C engine", path, e)
+        try:
+            df = pd.read_csv(path, parse_dates=True, index_col=0, usecols=usecols, engine='c')
+        except Exception as e2:
+            logger.exception("CSV adapter failed to read %s: %s", path, e2)
+            return pd.DataFrame()
+
+    # normalize common column names
+    df = df.rename(columns=lambda c: _COL_CANON.get(c.lower(), c))
+    df = cast_prices(df, kwargs.get('precision'), extra=_symbol_names(symbol))
 
-    # try to normalize common column names
-    rename_map = {}
-    for c in df.columns:
-        lc = c.lower()
-        if lc in ('open', 'open_price'):
-            rename_map[c] = 'Open'
-        elif lc in ('high',):
-            rename_map[c] = 'High'
-        elif lc in ('low',):
-            rename_map[c] = 'Low'
-        elif lc in ('close', 'close_price'):
-            rename_map[c] = 'Close'
-        elif lc in ('adj close', 'adj_close', 'adjclose'):
-            rename_map[c] = 'Adj Close'
-        elif lc in ('volume', 'vol'):
-            rename_map[c] = 'Volume'
-
-    if rename_map:
-        df = df.rename(columns=rename_map)
-
-    # ensure time index
+    # ensure sorted time index so range filtering is a binary-search slice
     if not isinstance(df.index, pd.DatetimeIndex):
-        df.index = pd.to_datetime(df.index)
+        df.index = _to_datetime_index(df.index)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
     # filter by time range
-    if start:
-        df = df[df.index >= pd.to_datetime(start)]
-    if end:
-        df = df[df.index <= pd.to_datetime(end)]
+    if start or end:
+        df = df.loc[_parse_date(start) if start else None:_parse_date(end) if end else None]
 
     logger.info("CSV adapter: fetched %s rows for %s", len(df), symbol)
     return df
@@ -1,12 +1,33 @@
 import yfinance as yf
 import pandas as pd
+from ..dtypes import cast_prices
 from ..exceptions import RateLimitError, AdapterError
+from ..ratelimit import TokenBucket
+from ..storage import cached
 # Use absolute import for logger (system package lives under src.system)
 from src.system.log import get_logger
 
 logger = get_logger(__name__)
 
+# pre-throttle upstream requests so bursts don't trip Yahoo's 429s
+_LIMITER = TokenBucket(rate=2, per=1.0)
+_SESSION = None
 
+
+def _session():
+    """Return a shared browser-impersonating curl_cffi session, or None if curl_cffi is missing."""
+    global _SESSION
+    if _SESSION is None:
+        try:
+            from curl_cffi import requests as curl_requests  # type: ignore
+        except ImportError:
+            _SESSION = False
+        else:
+            _SESSION = curl_requests.Session(impersonate='safari15_5')
+    return _SESSION or None
+
+
+@cached('yfinance')
 def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
     """Fetch historical data using yfinance and return a DataFrame (DatetimeIndex).
 
@@ -15,19 +36,25 @@ def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
     try:
         # specify auto_adjust to avoid future warnings
         logger.debug("yfinance adapter: fetching %s %s-%s interval=%s", symbol, start, end, interval)
-        df = yf.download(symbol, start=start, end=end, interval=interval, auto_adjust=adjusted, progress=False)
+        session = kwargs.get('session') or _session()
+        _LIMITER.acquire()
+        df = yf.download(symbol, start=start, end=end, interval=interval, auto_adjust=adjusted, progress=False,
+                         session=session)
         if df is None or df.empty:
             logger.info("yfinance adapter: no data for %s", symbol)
             return pd.DataFrame()
         # yfinance usually returns columns Open/High/Low/Close/Adj Close/Volume
         if not isinstance(df.index, pd.DatetimeIndex):
             df.index = pd.to_datetime(df.index)
+        df = cast_prices(df, kwargs.get('precision'))
         logger.info("yfinance adapter: fetched %s rows for %s", len(df), symbol)
         return df
     except Exception as e:
         # map likely rate-limit messages to RateLimitError
         msg = str(e).lower()
-        logger.exception("yfinance adapter error for %s: %s", symbol, e)
         if 'rate' in msg or 'limit' in msg or 'too many requests' in msg:
+            # throttling is routine and retried upstream; skip the traceback
+            logger.warning("yfinance adapter rate limited for %s: %s", symbol, e)
             raise RateLimitError(str(e))
+        logger.exception("yfinance adapter error for %s: %s", symbol, e)
         raise AdapterError(str(e))
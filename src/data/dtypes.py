@@ -0,0 +1,46 @@
+"""Price dtype policy shared by adapters and caches.
+
+`precision` in src/config.json picks the default: 'fp32' (default) stores
+price columns as float32 (half the memory/bandwidth, ~7 significant digits),
+'fp64' keeps full double precision. Volume keeps whatever integer dtype it was
+parsed as. Portfolio accounting always converts prices to Python floats, so
+fp32 data never turns cash/equity into float32 arithmetic.
+"""
+from pathlib import Path
+
+import pandas as pd
+
+from src.system.json import read_json
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'adj close', 'price')
+_DTYPES = {'fp32': 'float32', 'fp64': 'float64'}
+
+PRECISION = read_json(Path(__file__).resolve().parents[1] / 'config.json', {}).get('precision', 'fp32')
+
+
+def resolve_precision(precision=None):
+    precision = precision or PRECISION
+    if precision not in _DTYPES:
+        raise ValueError(f"Unknown precision: {precision!r} (expected 'fp32' or 'fp64')")
+    return precision
+
+
+def column_field(label):
+    """Lowercased field name of a column label; MultiIndex labels use the first level."""
+    return str(label[0] if isinstance(label, tuple) else label).lower()
+
+
+def cast_prices(df: pd.DataFrame, precision=None, extra=()):
+    """Cast price columns to the configured float dtype.
+
+    Matches PRICE_FIELDS case-insensitively (first level for MultiIndex) plus any
+    `extra` column names, e.g. a close column named after the symbol.
+    """
+    dtype = _DTYPES[resolve_precision(precision)]
+    extra = {str(e).lower() for e in extra}
+    cols = [c for c in df.columns
+            if (column_field(c) in PRICE_FIELDS or column_field(c) in extra)
+            and pd.api.types.is_numeric_dtype(df[c])]
+    if not cols:
+        return df
+    return df.astype({c: dtype for c in cols})
@@ -1,6 +1,7 @@
 import time
+import random
 import importlib
-from .storage import read_cached, write_cache
+from .storage import read_cached, write_cache, project_columns
 from .exceptions import RateLimitError, DataNotFoundError
 from src.system.log import get_logger
 
@@ -28,16 +29,19 @@ def select_adapter(name):
 
 
 def get_history(symbol, start, end, source='yfinance', interval='1d', adjusted=True,
-                cache=True, max_retries=3, backoff_factor=1, refresh=False, **kwargs):
+                cache=True, max_retries=3, backoff_factor=1, refresh=False, columns=None, **kwargs):
     """Unified external interface: prefer cached data first, otherwise fetch from the adapter and write to cache.
 
-    Implements a simple retry policy: on RateLimitError, retry with exponential backoff.
+    `columns` (e.g. ['Close']) limits the returned frame to those columns; cache
+    hits read only them from disk. The cache itself always stores the full frame.
+
+    Implements a simple retry policy: on RateLimitError, retry with exponential backoff plus jitter.
     """
     logger.info("get_history called: symbol=%s source=%s start=%s end=%s interval=%s cache=%s refresh=%s",
                 symbol, source, start, end, interval, cache, refresh)
 
     if cache and not refresh:
-        df = read_cached(symbol, start, end)
+        df = read_cached(symbol, start, end, columns=columns, precision=kwargs.get('precision'))
         if df is not None and not df.empty:
             logger.info("cache hit for %s rows=%s", symbol, len(df))
             return df
@@ -52,22 +56,23 @@ def get_history(symbol, start, end, source='yfinance', interval='1d', adjusted=T
     for attempt in range(max_retries):
         try:
             logger.debug("Attempt %d fetching %s from %s", attempt + 1, symbol, source)
-            df = adapter.fetch(symbol, start, end, interval=interval, adjusted=adjusted, **kwargs)
+            df = adapter.fetch(symbol, start, end, interval=interval, adjusted=adjusted,
+                               refresh=refresh, file_cache=cache, **kwargs)
             if df is None or df.empty:
                 # adapter returned empty -> treat as not found
                 logger.warning("Adapter returned empty for %s from %s", symbol, source)
                 raise DataNotFoundError(f"No data for {symbol} from {source}")
             if cache:
                 try:
-                    write_cache(symbol, df)
+                    write_cache(symbol, df, precision=kwargs.get('precision'))
                 except Exception:
                     logger.exception("Failed to write cache for %s", symbol)
             logger.info("Fetched data for %s rows=%s", symbol, len(df))
-            return df
+            return project_columns(df, columns)
         except RateLimitError as e:
             last_exc = e
-            wait = (2 ** attempt) * backoff_factor
-            logger.warning("Rate limit when fetching %s (attempt=%d), sleeping %s seconds", symbol, attempt + 1, wait)
+            wait = (2 ** attempt + random.random()) * backoff_factor
+            logger.warning("Rate limit when fetching %s (attempt=%d), sleeping %.2f seconds", symbol, attempt + 1, wait)
             time.sleep(wait)
             continue
         except DataNotFoundError:
@@ -1,66 +1,227 @@
+import functools
+import hashlib
 import os
-import os
+import time
 import pandas as pd
 from ..system.log import get_logger
+from .dtypes import column_field, resolve_precision
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow 缺失时退回 csv 缓存
+    pq = None
 
 logger = get_logger(__name__)
 
 CACHE_DIR = os.path.join(os.getcwd(), 'data')
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# 适配器响应缓存（按请求参数散列），与上面按 symbol 的缓存相互独立
+FETCH_CACHE_DIR = os.path.join(os.getcwd(), '.cache')
+INTRADAY_TTL = 24 * 3600
+DAILY_TTL = 90 * 24 * 3600
+# 空结果可能只是瞬时失败（yfinance 会吞掉网络/429 错误返回空表），只短暂记住
+EMPTY_TTL = 3600
+_DAILY_INTERVALS = ('1d', 'daily', '1wk', 'weekly', '1mo', 'monthly')
 
-def _cache_path(symbol):
-    # 简单按 symbol 存单文件（可扩展为按年月分片）
+
+def _cache_path(symbol, precision=None):
+    # 简单按 symbol 存单文件（可扩展为按年月分片）；非 fp64 精度单独存放，避免 fp64 读到截断后的数据
     safe = symbol.replace('/', '_')
-    return os.path.join(CACHE_DIR, f"{safe}.parquet")
+    precision = resolve_precision(precision)
+    suffix = '' if precision == 'fp64' else f'.{precision}'
+    return os.path.join(CACHE_DIR, f"{safe}{suffix}.parquet")
+
+
+def write_parquet(path, df: pd.DataFrame):
+    """Write `df` as snappy-compressed parquet via pyarrow."""
+    df.to_parquet(path, engine='pyarrow', compression='snappy')
+
+
+def _match_columns(available, columns):
+    # case-insensitive: adapters may return 'close' while callers ask for 'Close';
+    # MultiIndex labels like ('Close', 'AAPL') match on their first level
+    fields = [column_field(c) for c in available]
+    return [a for c in columns for a, f in zip(available, fields) if f == column_field(c)]
 
 
-def write_cache(symbol, df: pd.DataFrame):
-    path = _cache_path(symbol)
+def project_columns(df: pd.DataFrame, columns=None):
+    """Return `df` restricted to `columns` (matched case-insensitively).
+
+    Returns `df` unchanged when `columns` is None or none of them exist, so
+    callers never get a frame with zero columns.
+    """
+    if columns is None:
+        return df
+    names = _match_columns(df.columns, columns)
+    if not names:
+        logger.warning("None of columns %s found in %s; returning all columns", list(columns), list(df.columns))
+        return df
+    return df[names]
+
+
+def read_parquet(path, columns=None):
+    """Read a parquet file, loading only `columns` (plus the index) when given.
+
+    Falls back to reading every column when none of `columns` exist in the file.
+    """
+    if columns is None:
+        return pd.read_parquet(path, engine='pyarrow')
+    schema = pq.read_schema(path)
+    if len((schema.pandas_metadata or {}).get('column_indexes', [])) > 1:
+        # MultiIndex columns are stored under stringified names; project after loading
+        return project_columns(pd.read_parquet(path, engine='pyarrow'), columns)
+    names = _match_columns(schema.names, columns)
+    if not names:
+        logger.warning("None of columns %s found in %s; reading all columns", list(columns), path)
+        return pd.read_parquet(path, engine='pyarrow')
+    return pq.read_table(path, columns=names, use_pandas_metadata=True).to_pandas(self_destruct=True)
+
+
+def write_cache(symbol, df: pd.DataFrame, precision=None):
+    path = _cache_path(symbol, precision)
+    if pq is None:
+        csvp = path + '.csv'
+        try:
+            df.to_csv(csvp)
+            logger.warning("pyarrow not installed, wrote CSV cache for %s -> %s", symbol, csvp)
+        except Exception as e:
+            logger.exception("Failed to write cache for %s: %s", symbol, e)
+        return
     try:
-        df.to_parquet(path)
+        write_parquet(path, df)
         logger.info("Wrote cache for %s -> %s", symbol, path)
     except Exception as e:
-        # 回退到 csv
-        try:
-            csvp = path + '.csv'
-            df.to_csv(csvp)
-            logger.warning("Parquet write failed for %s, wrote CSV -> %s; error=%s", symbol, csvp, e)
-        except Exception as e2:
-            logger.exception("Failed to write cache for %s: %s", symbol, e2)
+        logger.exception("Failed to write cache for %s: %s", symbol, e)
 
 
-def read_cached(symbol, start=None, end=None):
-    path = _cache_path(symbol)
+def read_cached(symbol, start=None, end=None, columns=None, precision=None):
+    path = _cache_path(symbol, precision)
+    csvp = path + '.csv'
     df = None
-    if os.path.exists(path):
+    if pq is not None and os.path.exists(path):
         try:
-            df = pd.read_parquet(path)
+            df = read_parquet(path, columns)
             logger.info("Cache hit (parquet) for %s -> %s", symbol, path)
         except Exception as e:
             logger.warning("Failed reading parquet cache for %s: %s", symbol, e)
-            try:
-                df = pd.read_csv(path + '.csv', index_col=0, parse_dates=True)
-                logger.info("Read fallback CSV cache for %s", symbol)
-            except Exception as e2:
-                logger.warning("Failed reading CSV cache for %s: %s", symbol, e2)
-                return None
-    else:
-        # 也尝试 csv 后缀
-        csvp = path + '.csv'
-        if os.path.exists(csvp):
-            try:
-                df = pd.read_csv(csvp, index_col=0, parse_dates=True)
-                logger.info("Cache hit (csv) for %s -> %s", symbol, csvp)
-            except Exception as e:
-                logger.warning("Failed reading CSV cache for %s: %s", symbol, e)
-                return None
-        else:
-            logger.debug("No cache found for %s", symbol)
             return None
+    elif os.path.exists(csvp):
+        # 兼容旧的 csv 缓存
+        try:
+            df = project_columns(pd.read_csv(csvp, index_col=0, parse_dates=True), columns)
+            logger.info("Cache hit (csv) for %s -> %s", symbol, csvp)
+        except Exception as e:
+            logger.warning("Failed reading CSV cache for %s: %s", symbol, e)
+            return None
+    else:
+        logger.debug("No cache found for %s", symbol)
+        return None
 
     if start:
         df = df[df.index >= pd.to_datetime(start)]
     if end:
         df = df[df.index <= pd.to_datetime(end)]
     return df
+
+
+def default_ttl(interval, end, adjusted=False):
+    """Finalized unadjusted daily bars (range ending before today) keep 90 days, everything else 24h.
+
+    Adjusted bars are rewritten after every dividend/split, so they never count as finalized.
+    """
+    if adjusted or interval not in _DAILY_INTERVALS or not end:
+        return INTRADAY_TTL
+    try:
+        finalized = pd.to_datetime(end).normalize() < pd.Timestamp.now().normalize()
+    except Exception:
+        return INTRADAY_TTL
+    return DAILY_TTL if finalized else INTRADAY_TTL
+
+
+class FileCache:
+    """Adapter response cache stored as `.cache/{source}/{md5}.parquet`.
+
+    Empty responses are remembered with a `{md5}.empty` sentinel so known
+    empty ranges are not requested again for at most EMPTY_TTL seconds.
+    """
+
+    def __init__(self, source, root=FETCH_CACHE_DIR):
+        self.source = source
+        self.dir = os.path.join(root, source)
+
+    def key(self, symbol, start, end, interval, adjusted, precision=None):
+        raw = f"{self.source}|{symbol}|{start}|{end}|{interval}|{adjusted}|{resolve_precision(precision)}"
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.dir, f"{key}{suffix}")
+
+    @staticmethod
+    def _fresh(path, ttl):
+        try:
+            return time.time() - os.path.getmtime(path) < ttl
+        except OSError:
+            return False
+
+    def get(self, key, ttl):
+        """Return the cached frame (empty for a negative entry), or None on miss/expiry."""
+        if self._fresh(self._path(key, '.empty'), min(ttl, EMPTY_TTL)):
+            return pd.DataFrame()
+        path = self._path(key, '.parquet')
+        if pq is None or not self._fresh(path, ttl):
+            return None
+        try:
+            return read_parquet(path)
+        except Exception as e:
+            logger.warning("Failed reading fetch cache %s: %s", path, e)
+            return None
+
+    def put(self, key, df):
+        os.makedirs(self.dir, exist_ok=True)
+        empty = self._path(key, '.empty')
+        if df is None or df.empty:
+            with open(empty, 'w', encoding='utf-8'):
+                pass
+            return
+        if os.path.exists(empty):
+            os.remove(empty)
+        if pq is None:
+            return
+        write_parquet(self._path(key, '.parquet'), df)
+
+
+def cached(source, ttl=None, root=FETCH_CACHE_DIR):
+    """Decorate an adapter `fetch` with a FileCache keyed on the request parameters.
+
+    `ttl` (seconds) overrides `default_ttl`. Callers may pass `refresh=True`
+    to bypass the read, or `file_cache=False` to skip the cache entirely.
+    """
+    cache = FileCache(source, root)
+
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(symbol, start, end, interval='1d', adjusted=True, **kwargs):
+            refresh = kwargs.pop('refresh', False)
+            if not kwargs.pop('file_cache', True):
+                return fetch(symbol, start, end, interval=interval, adjusted=adjusted, **kwargs)
+
+            key = cache.key(symbol, start, end, interval, adjusted, kwargs.get('precision'))
+            if not refresh:
+                df = cache.get(key, ttl if ttl is not None else default_ttl(interval, end, adjusted))
+                if df is not None:
+                    logger.info("%s fetch cache hit for %s (%s rows)", source, symbol, len(df))
+                    return df
+
+            df = fetch(symbol, start, end, interval=interval, adjusted=adjusted, **kwargs)
+            try:
+                cache.put(key, df)
+            except Exception as e:
+                logger.warning("Failed writing %s fetch cache for %s: %s", source, symbol, e)
+            return df
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
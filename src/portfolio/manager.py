@@ -48,6 +48,8 @@ class PortfolioManager:
 			px = prices.get(sym)
 			if px is None:
 				continue
+			# keep accounting in float64 even when price data is float32
+			px = float(px)
 			# apply slippage
 			fill_px = px * (1 + self.slippage if qty > 0 else 1 - self.slippage)
 			cost = fill_px * qty
@@ -80,7 +82,7 @@ def run_backtest(strategy, data: pd.DataFrame, commission: float, slippage: floa
 		# build history up to current bar (inclusive)
 		history = data.loc[:dt]
 		orders = strategy.decide(dt, history)
-		prices = {strategy.symbol: row['Close']}
+		prices = {strategy.symbol: float(row['Close'])}
 		fills = pm.apply_orders(orders, prices)
 		# record fills with timestamp
 		for f in fills:
@@ -0,0 +1,133 @@
+"""Numba-compiled SMA crossover kernels for batch backtests and parameter sweeps.
+
+Falls back to plain Python loops when numba is not installed.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+	from numba import cuda, njit, prange
+except ImportError:  # numba is optional
+	cuda = None
+	prange = range
+
+	def njit(*args, **kwargs):
+		if len(args) == 1 and callable(args[0]):
+			return args[0]
+		return lambda func: func
+
+
+def as_price_array(closes) -> np.ndarray:
+	"""Contiguous close array for the kernels; float32 input stays float32 (sums are float64)."""
+	arr = np.asarray(closes)
+	return np.ascontiguousarray(arr, dtype=arr.dtype if arr.dtype in (np.float32, np.float64) else np.float64)
+
+
+def _crossover_into(closes, s, l, out):
+	# Shared loop body: compiled with njit for the CPU and as a CUDA device function.
+	# Accepts float32 or float64 closes; running sums are always float64. Non-finite
+	# closes are skipped via per-window valid counts, like rolling(min_periods=1).mean().
+	n = closes.shape[0]
+	ss = 0.0
+	ls = 0.0
+	sc = 0
+	lc = 0
+	# NaN compares false, so the first bar can never signal
+	prev_short = math.nan
+	prev_long = math.nan
+	for i in range(n):
+		x = closes[i]
+		if math.isfinite(x):
+			ss += x
+			ls += x
+			sc += 1
+			lc += 1
+		if i >= s and math.isfinite(closes[i - s]):
+			ss -= closes[i - s]
+			sc -= 1
+		if i >= l and math.isfinite(closes[i - l]):
+			ls -= closes[i - l]
+			lc -= 1
+		cur_short = ss / sc if sc > 0 else math.nan
+		cur_long = ls / lc if lc > 0 else math.nan
+		# branchless edge test: at most one of buy/sell can hold (cur > vs cur <)
+		buy = (prev_short <= prev_long) & (cur_short > cur_long)
+		sell = (prev_short >= prev_long) & (cur_short < cur_long)
+		out[i] = np.int8(buy) - np.int8(sell)
+		prev_short = cur_short
+		prev_long = cur_long
+
+
+_crossover_into_cpu = njit(cache=True)(_crossover_into)
+
+
+@njit(cache=True)
+def sma_crossover(closes, s, l):
+	"""Return int8 signals (+1 buy, -1 sell, 0 none) for a short/long SMA crossover.
+
+	Rolling sums are updated incrementally; warm-up bars average over the
+	bars seen so far (min_periods=1) and NaN closes are skipped, matching
+	SMAStrategy.decide. Compiled without fastmath so NaN semantics hold.
+	"""
+	out = np.empty(closes.shape[0], dtype=np.int8)
+	_crossover_into_cpu(closes, s, l, out)
+	return out
+
+
+@njit(cache=True, parallel=True)
+def _grid_cpu(closes, shorts, longs, out):
+	for k in prange(shorts.shape[0]):
+		_crossover_into_cpu(closes, shorts[k], longs[k], out[k])
+
+
+def _gpu_available() -> bool:
+	return cuda is not None and cuda.is_available()
+
+
+@lru_cache(maxsize=None)
+def _cuda_grid_kernel():
+	crossover = cuda.jit(device=True)(_crossover_into)
+
+	@cuda.jit
+	def kernel(closes, shorts, longs, out):
+		# one thread per (short, long) pair, striding through time
+		k = cuda.grid(1)
+		if k < shorts.shape[0]:
+			crossover(closes, shorts[k], longs[k], out[k])
+
+	return kernel
+
+
+def sma_grid_search(closes, params: List[Tuple[int, int]], threads_per_block: int = 128) -> np.ndarray:
+	"""Evaluate SMA crossover signals for every (short, long) pair over one close series.
+
+	Returns a (K, N) int8 matrix, row k holding the signals for params[k].
+	Runs one CUDA thread per pair when a GPU is available (closes is copied
+	to the device once), otherwise a prange-parallel CPU loop.
+	"""
+	closes = as_price_array(closes)
+	shorts = np.array([p[0] for p in params], dtype=np.int64)
+	longs = np.array([p[1] for p in params], dtype=np.int64)
+	out = np.empty((len(params), closes.shape[0]), dtype=np.int8)
+	if not params:
+		return out
+
+	if not _gpu_available():
+		_grid_cpu(closes, shorts, longs, out)
+		return out
+
+	d_out = cuda.device_array(out.shape, dtype=np.int8)
+	blocks = (len(params) + threads_per_block - 1) // threads_per_block
+	_cuda_grid_kernel()[blocks, threads_per_block](
+		cuda.to_device(closes), cuda.to_device(shorts), cuda.to_device(longs), d_out
+	)
+	return d_out.copy_to_host()
+
+
+__all__ = ["as_price_array", "sma_crossover", "sma_grid_search"]
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import math
+import operator
+from typing import Callable, Dict
+
+import numpy as np
 import pandas as pd
-from typing import Dict
 
-from src.strategy.calc_lines import CLOSE, MA, MACD
+from src.strategy._sma_numba import as_price_array, sma_crossover
+from src.strategy.calc_lines import CLOSE, MACD
 from src.strategy.support import TriggerSet, crossabove, crossbelow
 from src.system.log import get_logger
 
@@ -17,6 +22,8 @@ class SMAStrategy:
 
     def __init__(self, symbol: str, short_window: int = 5, long_window: int = 20, qty: int = 100) -> None:
         self.symbol = symbol
+        # the columns _bind_extract may pick from; lets the data layer skip the rest on disk
+        self.required_columns = [symbol, "Close"]
         self.short_window = short_window
         self.long_window = long_window
         self.qty = qty
@@ -28,28 +35,97 @@ class SMAStrategy:
             logger.warning("SMAStrategy: qty uses default=100")
         self._orders: Dict[str, int] = {}
         self._triggers = TriggerSet()
+        self._extract: Callable[[pd.DataFrame], pd.Series] | None = None
+        self._reset()
 
         # Register triggers: buy on short crossing above long; sell on short crossing below long.
+        # SMAs are maintained incrementally, so compare scalar prev/current values.
         self._triggers.always(
-            lambda ctx: bool(crossabove(ctx["sma_short"], ctx["sma_long"]).iloc[-1]),
+            lambda ctx: ctx["prev_short"] <= ctx["prev_long"] and ctx["sma_short"] > ctx["sma_long"],
             lambda ctx: self._orders.__setitem__(self.symbol, self.qty),
             name="sma_buy_cross",
         )
         self._triggers.always(
-            lambda ctx: bool(crossbelow(ctx["sma_short"], ctx["sma_long"]).iloc[-1]),
+            lambda ctx: ctx["prev_short"] >= ctx["prev_long"] and ctx["sma_short"] < ctx["sma_long"],
             lambda ctx: self._orders.__setitem__(self.symbol, -self.qty),
             name="sma_sell_cross",
         )
 
     def _select_price(self, history: pd.DataFrame) -> pd.Series | None:
-        if self.symbol in history.columns:
-            return CLOSE(history[[self.symbol]].rename(columns={self.symbol: "close"}))
-        if "Close" in history.columns:
-            return history["Close"]
-        if "close" in history.columns:
-            return history["close"]
+        # The price column is resolved on the first bar and reused afterwards;
+        # a KeyError (columns changed) triggers one re-resolution.
+        if self._extract is None:
+            self._extract = self._bind_extract(history)
+            if self._extract is None:
+                return None
+        try:
+            return self._extract(history)
+        except KeyError:
+            self._extract = None
+            return self._select_price(history)
+
+    def _bind_extract(self, history: pd.DataFrame) -> Callable[[pd.DataFrame], pd.Series] | None:
+        for col in (self.symbol, "Close", "close"):
+            if col in history.columns:
+                return operator.itemgetter(col)
         return None
 
+    def _reset(self) -> None:
+        # contiguous float64 ring buffer holding the most recent closes
+        self._buf = np.empty(max(self.short_window, self.long_window), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self.short_sum = 0.0
+        self.long_sum = 0.0
+        # finite closes currently inside each window (NaNs are skipped, like rolling().mean())
+        self.short_valid = 0
+        self.long_valid = 0
+        self._prev_sma: tuple[float, float] | None = None
+        self._last_ts = None
+
+    def on_bar(self, close: float) -> None:
+        """Push one close and update the running window sums in O(1); non-finite closes are skipped."""
+        size = self._buf.shape[0]
+        if self._count >= self.short_window:
+            old = self._buf[(self._head - self.short_window) % size]
+            if math.isfinite(old):
+                self.short_sum -= old
+                self.short_valid -= 1
+        if self._count >= self.long_window:
+            old = self._buf[(self._head - self.long_window) % size]
+            if math.isfinite(old):
+                self.long_sum -= old
+                self.long_valid -= 1
+        self._buf[self._head % size] = close
+        self._head += 1
+        self._count = min(self._count + 1, size)
+        if math.isfinite(close):
+            self.short_sum += close
+            self.long_sum += close
+            self.short_valid += 1
+            self.long_valid += 1
+
+    def generate_signals(self) -> tuple[float, float]:
+        """Return (short_sma, long_sma) over the finite closes in each window; NaN if a window has none."""
+        short_sma = self.short_sum / self.short_valid if self.short_valid else math.nan
+        long_sma = self.long_sum / self.long_valid if self.long_valid else math.nan
+        return short_sma, long_sma
+
+    def _feed(self, price: pd.Series) -> None:
+        # Only push bars newer than the last one seen; replay the tail when
+        # the history does not extend what we already consumed.
+        last = price.index[-1]
+        if self._last_ts is not None and self._last_ts <= last and self._last_ts in price.index:
+            new = price.loc[self._last_ts:].iloc[1:]
+        else:
+            self._reset()
+            new = price.iloc[-(self.long_window + 1):]
+        for close in new.to_numpy(dtype=float):
+            if self._count:
+                self._prev_sma = self.generate_signals()
+            self.on_bar(close)
+        self._last_ts = last
+
     def decide(self, date: pd.Timestamp, history: pd.DataFrame) -> Dict[str, int]:
         if history.empty:
             return {}
@@ -58,15 +134,24 @@ class SMAStrategy:
         if price is None:
             return {}
 
+        self._feed(price)
+        sma_short, sma_long = self.generate_signals()
+        prev_short, prev_long = self._prev_sma if self._prev_sma is not None else (sma_short, sma_long)
         ctx = {
-            "sma_short": MA(price, self.short_window),
-            "sma_long": MA(price, self.long_window),
+            "sma_short": sma_short,
+            "sma_long": sma_long,
+            "prev_short": prev_short,
+            "prev_long": prev_long,
         }
 
         self._orders.clear()
         self._triggers.run(ctx)
         return dict(self._orders)
 
+    def run_vectorized(self, closes) -> np.ndarray:
+        """Compute crossover signals (+1/-1/0 per bar) over a full close array in one pass."""
+        return sma_crossover(as_price_array(closes), self.short_window, self.long_window)
+
 
 class MACDStrategy:
     """MACD crossover strategy (MACD line vs signal line)."""
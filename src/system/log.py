@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 
@@ -15,6 +18,10 @@ def _make_log_path():
 def configure_root_logger(level=logging.INFO):
     """Configure root logger to write to a timestamped file only.
 
+    Records are put on an in-memory queue by a QueueHandler; a background
+    QueueListener thread does the actual file writes, so callers never block
+    on disk I/O. The listener is flushed and stopped at interpreter exit.
+
     This is idempotent: calling multiple times won't add duplicate handlers.
     It removes any existing StreamHandler to avoid stdout/stderr logging.
     Ensures idempotence.
@@ -35,7 +42,12 @@ def configure_root_logger(level=logging.INFO):
     fh.setLevel(level)
     fh_formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
     fh.setFormatter(fh_formatter)
-    root.addHandler(fh)
+
+    q = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(q))
+    listener = logging.handlers.QueueListener(q, fh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     root._beruto_configured = True
 
@@ -3,6 +3,8 @@ import akshare as ak
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Union, List
 import warnings
 
@@ -25,6 +27,8 @@ class AKFinance:
             - 美股: 'AAPL'、'TSLA'
         """
         self.ticker = self._standardize_ticker(ticker)
+        # 代码与交易所只解析一次，避免各方法重复 split
+        self._code, _, self._exchange = self.ticker.partition('.')
         self.history_data = None
 
     def _standardize_ticker(self, ticker: str) -> str:
@@ -71,8 +75,7 @@ class AKFinance:
     def info(self) -> dict:
         """获取股票基本信息"""
         try:
-            ticker_clean = self.ticker.split('.')[0]
-            exchange = self.ticker.split('.')[-1] if '.' in self.ticker else ''
+            ticker_clean, exchange = self._code, self._exchange
 
             print(f"获取股票信息: {self.ticker}, 代码: {ticker_clean}, 交易所: {exchange}")
 
@@ -125,9 +128,9 @@ class AKFinance:
         """获取默认信息"""
         return {
             'symbol': self.ticker,
-            'shortName': self.ticker.split('.')[0],
-            'longName': self.ticker.split('.')[0],
-            'exchange': self.ticker.split('.')[-1] if '.' in self.ticker else 'Unknown',
+            'shortName': self._code,
+            'longName': self._code,
+            'exchange': self._exchange or 'Unknown',
             'currency': 'CNY',
             'market': 'cn'
         }
@@ -143,8 +146,7 @@ class AKFinance:
         获取历史价格数据
         """
         try:
-            ticker_clean = self.ticker.split('.')[0]
-            exchange = self.ticker.split('.')[-1] if '.' in self.ticker else ''
+            ticker_clean, exchange = self._code, self._exchange
 
             # 设置默认日期范围
             end_date = self._convert_date(end) if end else datetime.now().strftime('%Y%m%d')
@@ -238,13 +240,10 @@ class AKFinance:
         if df is None or df.empty:
             return pd.DataFrame()
 
-        # 复制 DataFrame 避免修改原始数据
-        df = df.copy()
-
         print(f"原始数据列名: {df.columns.tolist()}")
         print(f"原始数据形状: {df.shape}")
 
-        # 重命名列
+        # 重命名列（rename 返回新对象，原始数据不会被修改，无需先整表复制）
         column_mapping = self._get_column_mapping(exchange)
         df = df.rename(columns=column_mapping)
 
@@ -257,7 +256,7 @@ class AKFinance:
                 break
 
         if date_column:
-            df[date_column] = pd.to_datetime(df[date_column])
+            df[date_column] = _to_datetime(df[date_column])
             df = df.set_index(date_column)
             print(f"使用日期列: {date_column}")
         else:
@@ -299,14 +298,13 @@ class AKFinance:
     def dividends(self) -> pd.Series:
         """获取股息数据"""
         try:
-            ticker_clean = self.ticker.split('.')[0]
-            exchange = self.ticker.split('.')[-1] if '.' in self.ticker else ''
+            ticker_clean, exchange = self._code, self._exchange
 
             if exchange in ['SH', 'SZ']:
                 print(f"获取股息数据: {ticker_clean}")
                 div_df = self._safe_ak_call(ak.stock_dividend_detail, indicator="分红", symbol=ticker_clean)
                 if not div_df.empty and '除权除息日' in div_df.columns and '派息比例' in div_df.columns:
-                    div_df['除权除息日'] = pd.to_datetime(div_df['除权除息日'])
+                    div_df['除权除息日'] = _to_datetime(div_df['除权除息日'])
                     div_df = div_df.set_index('除权除息日')
                     return div_df['派息比例']
             return pd.Series()
@@ -317,14 +315,13 @@ class AKFinance:
     def splits(self) -> pd.Series:
         """获取拆股数据"""
         try:
-            ticker_clean = self.ticker.split('.')[0]
-            exchange = self.ticker.split('.')[-1] if '.' in self.ticker else ''
+            ticker_clean, exchange = self._code, self._exchange
 
             if exchange in ['SH', 'SZ']:
                 print(f"获取拆股数据: {ticker_clean}")
                 split_df = self._safe_ak_call(ak.stock_dividend_detail, indicator="拆股", symbol=ticker_clean)
                 if not split_df.empty and '除权除息日' in split_df.columns and '送转比例' in split_df.columns:
-                    split_df['除权除息日'] = pd.to_datetime(split_df['除权除息日'])
+                    split_df['除权除息日'] = _to_datetime(split_df['除权除息日'])
                     split_df = split_df.set_index('除权除息日')
                     return split_df['送转比例']
             return pd.Series()
@@ -333,10 +330,39 @@ class AKFinance:
             return pd.Series()
 
 
+def _to_datetime(col: pd.Series) -> pd.Series:
+    """解析日期列：YYYYMMDD / YYYY-MM-DD 字符串走固定格式的快速路径，其他情况自动推断"""
+    sample = col.iloc[0] if len(col) else None
+    fmt = None
+    if isinstance(sample, str):
+        if len(sample) == 8 and sample.isdigit():
+            fmt = '%Y%m%d'
+        elif len(sample) == 10 and sample[4] == '-':
+            fmt = '%Y-%m-%d'
+    return pd.to_datetime(col, format=fmt, cache=True)
+
+
 # 为兼容性添加 Ticker 类别名
 Ticker = AKFinance
 
 
+def _download_one(symbol: str, progress: bool, **history_kwargs) -> Optional[pd.DataFrame]:
+    """在工作线程中下载单只股票（AKShare 调用是阻塞的网络请求）"""
+    if progress:
+        print(f"\n正在下载 {symbol}...")
+    try:
+        df = AKFinance(symbol).history(**history_kwargs)
+    except Exception as e:
+        print(f"下载 {symbol} 失败: {e}")
+        return None
+
+    if df.empty:
+        print(f"未获取到 {symbol} 的数据")
+        return None
+    print(f"成功下载 {symbol}，数据形状: {df.shape}")
+    return df
+
+
 # 模拟 yfinance 的 download 函数
 def download(symbols: Union[str, List[str]],
              start: Optional[str] = None,
@@ -347,58 +373,37 @@ def download(symbols: Union[str, List[str]],
              auto_adjust: bool = True,
              actions: bool = False,
              threads: bool = True,
-             progress: bool = True) -> pd.DataFrame:
+             progress: bool = True,
+             max_concurrency: int = 5) -> pd.DataFrame:
     """
     模拟 yfinance.download 函数
+
+    多只股票并发下载，最多同时 `max_concurrency` 个请求；`threads=False` 时逐个下载。
     """
     if isinstance(symbols, str):
         symbols = [symbols]
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency 必须 >= 1，当前为 {max_concurrency}")
 
-    result_dfs = []
+    fetch_one = partial(_download_one, progress=progress, start=start, end=end, period=period,
+                        interval=interval, auto_adjust=auto_adjust)
+    # 普通线程池即可：不依赖事件循环，Jupyter / 异步调用方中也能直接使用
+    with ThreadPoolExecutor(max_workers=max_concurrency if threads else 1) as executor:
+        results = list(executor.map(fetch_one, symbols))
 
-    for symbol in symbols:
-        if progress:
-            print(f"\n正在下载 {symbol}...")
+    downloaded = [(symbol, df) for symbol, df in zip(symbols, results) if df is not None]
 
-        try:
-            ak_stock = AKFinance(symbol)
-            df = ak_stock.history(start=start, end=end, period=period,
-                                  interval=interval, auto_adjust=auto_adjust)
-
-            if not df.empty:
-                print(f"成功下载 {symbol}，数据形状: {df.shape}")
-                # 添加多级列索引以匹配 yfinance
-                if len(symbols) > 1:
-                    df.columns = pd.MultiIndex.from_product([[symbol], df.columns])
-                result_dfs.append(df)
-            else:
-                print(f"未获取到 {symbol} 的数据")
-
-        except Exception as e:
-            print(f"下载 {symbol} 失败: {e}")
-            continue
-
-    if not result_dfs:
+    if not downloaded:
         print("所有股票数据获取失败")
         return pd.DataFrame()
 
     # 合并所有数据
-    if len(result_dfs) == 1:
-        final_df = result_dfs[0]
+    if len(symbols) == 1:
+        final_df = downloaded[0][1]
     else:
-        # 对齐索引并合并
-        all_dates = set()
-        for df in result_dfs:
-            all_dates.update(df.index)
-
-        all_dates = sorted(all_dates)
-        combined_df = pd.DataFrame(index=all_dates)
-
-        for df in result_dfs:
-            for col in df.columns:
-                combined_df[col] = df[col]
-
-        final_df = combined_df
+        # 一次性按日期并集对齐，列为 (Ticker, Field) 多级索引以匹配 yfinance
+        final_df = pd.concat([df for _, df in downloaded], axis=1, sort=True,
+                             keys=[symbol for symbol, _ in downloaded], names=['Ticker', 'Field'])
 
     print(f"\n最终数据形状: {final_df.shape}")
     return final_df
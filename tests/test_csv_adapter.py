@@ -0,0 +1,45 @@
+from src.data.adapters import csv_adapter
+
+
+def test_csv_keeps_price_and_symbol_columns(tmp_path):
+    path = tmp_path / 'sh600000.csv'
+    path.write_text(
+        'date,sh600000,price,close,amount\n'
+        '2020-01-02,1.3,1.3,1.3,9\n'
+        '2020-01-01,1.2,1.2,1.2,8\n',
+        encoding='utf-8',
+    )
+    df = csv_adapter.fetch('sh600000', None, None, csv_base=str(tmp_path))
+    assert list(df.columns) == ['sh600000', 'price', 'Close']
+    assert df.index.is_monotonic_increasing
+    assert (df.dtypes == 'float32').all()
+
+    by_path = csv_adapter.fetch(str(path), '2020-01-02', None)
+    assert 'sh600000' in by_path.columns
+    assert len(by_path) == 1
+
+
+def test_csv_parses_yyyymmdd_dates(tmp_path):
+    path = tmp_path / 'ak.csv'
+    path.write_text(
+        'date,open,close\n'
+        '20200103,1,1.5\n'
+        '20200101,1,1.2\n'
+        '20200102,1,1.3\n',
+        encoding='utf-8',
+    )
+    df = csv_adapter.fetch(str(path), '20200102', '20200103')
+    assert list(df.index.strftime('%Y-%m-%d')) == ['2020-01-02', '2020-01-03']
+
+
+def test_csv_ragged_rows_still_read(tmp_path):
+    path = tmp_path / 'ragged.csv'
+    path.write_text(
+        'date,open,close\n'
+        '2020-01-01,1,1.2\n'
+        '2020-01-02,1\n',
+        encoding='utf-8',
+    )
+    df = csv_adapter.fetch(str(path), None, None)
+    assert len(df) == 2
+    assert df['Close'].isna().iloc[1]
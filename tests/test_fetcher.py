@@ -23,7 +23,7 @@ def main():
         df = fetcher.get_history(symbol, start_date, end_date, source='akshare', cache=True, refresh=False)
         print(f"Fetched rows: {len(df)}")
         if not df.empty:
-            print("Cached to disk under data_cache/ (parquet or csv fallback)")
+            print("Cached to disk under data/ (snappy parquet; csv only without pyarrow)")
     except AdapterError as ae:
         print("Adapter error:", ae)
         print("Hint: ensure `akshare` is installed in your environment: `pip install akshare`")
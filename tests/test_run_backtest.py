@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.portfolio.manager import run_backtest
+from src.strategy.yahan_strategies import SMAStrategy
+
+
+def _closes(n=500, seed=3):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range('2020-01-01', periods=n, freq='D')
+    return pd.DataFrame({'Close': 100 + rng.standard_normal(n).cumsum() * 0.5}, index=idx)
+
+
+def _final_equity(df):
+    strat = SMAStrategy('X', short_window=5, long_window=20, qty=1000)
+    curve, _ = run_backtest(strat, df, commission=0.0005, slippage=0.0005, initial_cash=1_000_000.0)
+    return curve['equity'].iloc[-1], curve['cash'].dtype
+
+
+def test_run_backtest_accounting_stays_float64_with_fp32_prices():
+    df64 = _closes()
+    df32 = df64.astype({'Close': 'float32'})
+    equity32, cash_dtype = _final_equity(df32)
+    assert cash_dtype == np.float64
+
+    # same trades priced at the float32-rounded closes, accounted in float64
+    reference, _ = _final_equity(df32.astype({'Close': 'float64'}))
+    assert equity32 == pytest.approx(reference, abs=1e-6)
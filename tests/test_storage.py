@@ -0,0 +1,111 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.data import storage
+from src.data.dtypes import cast_prices
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _ohlc():
+    idx = pd.DatetimeIndex(['2020-01-01', '2020-01-02'], name='date')
+    return pd.DataFrame({'Close': [1234.5678901, 2.0], 'Volume': [10, 20]}, index=idx)
+
+
+def test_symbol_cache_is_keyed_on_precision(cache_dir):
+    storage.write_cache('T', cast_prices(_ohlc(), 'fp32'), precision='fp32')
+    assert storage.read_cached('T', precision='fp64') is None
+
+    storage.write_cache('T', _ohlc(), precision='fp64')
+    assert storage.read_cached('T', precision='fp64')['Close'].iloc[0] == 1234.5678901
+    assert storage.read_cached('T', precision='fp32')['Close'].dtype == 'float32'
+
+
+def _stub_fetch(tmp_path, frames):
+    calls = []
+
+    @storage.cached('stub', root=str(tmp_path))
+    def fetch(symbol, start, end, interval='1d', adjusted=True, **kwargs):
+        calls.append(symbol)
+        return frames[symbol]
+
+    return fetch, calls
+
+
+def _age(fetch, seconds):
+    for f in os.listdir(fetch.cache.dir):
+        path = os.path.join(fetch.cache.dir, f)
+        t = os.path.getmtime(path) - seconds
+        os.utime(path, (t, t))
+
+
+def test_file_cache_hit_refresh_and_bypass(tmp_path):
+    fetch, calls = _stub_fetch(tmp_path, {'A': _ohlc()})
+    first = fetch('A', '20200101', '20200102')
+    cached = fetch('A', '20200101', '20200102')
+    pd.testing.assert_frame_equal(first, cached, check_freq=False)
+    assert calls == ['A']
+
+    fetch('A', '20200101', '20200102', refresh=True)
+    fetch('A', '20200101', '20200102', file_cache=False)
+    assert calls == ['A', 'A', 'A']
+
+
+def test_file_cache_entry_expires_after_ttl(tmp_path):
+    fetch, calls = _stub_fetch(tmp_path, {'A': _ohlc()})
+    fetch('A', '20200101', '20200102', adjusted=False)
+    _age(fetch, storage.DAILY_TTL - 60)
+    fetch('A', '20200101', '20200102', adjusted=False)
+    assert calls == ['A']
+    _age(fetch, 120)
+    fetch('A', '20200101', '20200102', adjusted=False)
+    assert calls == ['A', 'A']
+
+
+def test_empty_sentinel_uses_short_ttl(tmp_path):
+    fetch, calls = _stub_fetch(tmp_path, {'E': pd.DataFrame()})
+    assert fetch('E', '20200101', '20200102', adjusted=False).empty
+    assert fetch('E', '20200101', '20200102', adjusted=False).empty
+    assert calls == ['E']
+    assert any(f.endswith('.empty') for f in os.listdir(fetch.cache.dir))
+
+    _age(fetch, storage.EMPTY_TTL + 1)
+    fetch('E', '20200101', '20200102', adjusted=False)
+    assert calls == ['E', 'E']
+
+
+def test_default_ttl_only_finalizes_unadjusted_daily_ranges():
+    assert storage.default_ttl('1d', '20200102', adjusted=False) == storage.DAILY_TTL
+    assert storage.default_ttl('1d', '20200102', adjusted=True) == storage.INTRADAY_TTL
+    assert storage.default_ttl('5m', '20200102', adjusted=False) == storage.INTRADAY_TTL
+    assert storage.default_ttl('1d', None, adjusted=False) == storage.INTRADAY_TTL
+
+
+def test_read_cached_projects_columns_and_keeps_index(cache_dir):
+    storage.write_cache('T', _ohlc())
+    df = storage.read_cached('T', columns=['close'])
+    assert list(df.columns) == ['Close']
+    assert df.index.name == 'date'
+    assert isinstance(df.index, pd.DatetimeIndex)
+    pd.testing.assert_index_equal(df.index, _ohlc().index)
+
+
+def test_missing_projection_columns_fall_back_to_full_frame(cache_dir):
+    storage.write_cache('T', _ohlc())
+    assert list(storage.read_cached('T', columns=['Adj Close']).columns) == ['Close', 'Volume']
+    assert list(storage.project_columns(_ohlc(), ['Adj Close']).columns) == ['Close', 'Volume']
+
+
+def test_projection_matches_multiindex_first_level(cache_dir):
+    cols = pd.MultiIndex.from_product([['Close', 'Volume'], ['AAPL', 'MSFT']], names=['Price', 'Ticker'])
+    df = pd.DataFrame([[1.0, 2.0, 3, 4]], columns=cols, index=pd.DatetimeIndex(['2020-01-01'], name='Date'))
+    expected = [('Close', 'AAPL'), ('Close', 'MSFT')]
+    assert list(storage.project_columns(df, ['close']).columns) == expected
+    storage.write_cache('M', df)
+    assert list(storage.read_cached('M', columns=['Close']).columns) == expected
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from src.data.storage import project_columns
+from src.strategy._sma_numba import sma_crossover, sma_grid_search
+from src.strategy.calc_lines import MA
+from src.strategy.support import crossabove, crossbelow
+from src.strategy.yahan_strategies import SMAStrategy
+
+
+def _price_frame(n=300, seed=0, nan_at=()):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range('2020-01-01', periods=n, freq='D')
+    df = pd.DataFrame({'Close': 100 + rng.standard_normal(n).cumsum()}, index=idx)
+    df.iloc[list(nan_at), 0] = np.nan
+    return df
+
+
+def _reference_orders(df, short, long, qty):
+    orders = []
+    for dt in df.index:
+        price = df.loc[:dt, 'Close']
+        a, b = MA(price, short), MA(price, long)
+        if crossabove(a, b).iloc[-1]:
+            orders.append(qty)
+        elif crossbelow(a, b).iloc[-1]:
+            orders.append(-qty)
+        else:
+            orders.append(0)
+    return orders
+
+
+def test_sma_incremental_matches_rolling_mean():
+    df = _price_frame()
+    strat = SMAStrategy('X', short_window=3, long_window=10, qty=1)
+    orders = [strat.decide(dt, df.loc[:dt]).get('X', 0) for dt in df.index]
+    assert orders == _reference_orders(df, 3, 10, 1)
+    assert any(orders)
+
+
+def test_sma_incremental_skips_nan_closes_like_rolling_mean():
+    # a lone NaN plus a run longer than the short window
+    df = _price_frame(nan_at=[100] + list(range(200, 205)))
+    strat = SMAStrategy('X', short_window=3, long_window=10, qty=1)
+    orders = [strat.decide(dt, df.loc[:dt]).get('X', 0) for dt in df.index]
+    assert orders == _reference_orders(df, 3, 10, 1)
+    assert any(orders[101:])
+
+
+def test_run_vectorized_matches_decide():
+    df = _price_frame(seed=1)
+    strat = SMAStrategy('X', short_window=5, long_window=20, qty=1)
+    signals = strat.run_vectorized(df['Close'])
+    assert signals.dtype == np.int8
+    assert signals.tolist() == _reference_orders(df, 5, 20, 1)
+
+
+def test_run_vectorized_skips_nan_closes():
+    df = _price_frame(seed=1, nan_at=[0, 100] + list(range(200, 208)))
+    strat = SMAStrategy('X', short_window=5, long_window=20, qty=1)
+    signals = strat.run_vectorized(df['Close'])
+    assert signals.tolist() == _reference_orders(df, 5, 20, 1)
+    assert signals[101:].any()
+
+
+def test_sma_grid_search_rows_match_single_kernel():
+    closes = _price_frame(seed=2)['Close'].to_numpy()
+    params = [(3, 10), (5, 20), (8, 30)]
+    grid = sma_grid_search(closes, params)
+    assert grid.shape == (len(params), len(closes))
+    for row, (s, l) in zip(grid, params):
+        assert (row == sma_crossover(closes, s, l)).all()
+
+
+def test_required_columns_keep_the_symbol_column():
+    s = SMAStrategy("AAPL", short_window=2, long_window=3, qty=1)
+    frame = pd.DataFrame({"AAPL": [1.0], "Close": [2.0], "Volume": [10]})
+    projected = project_columns(frame, s.required_columns)
+    assert list(projected.columns) == ["AAPL", "Close"]
+    assert s._bind_extract(projected)(projected).iloc[0] == 1.0